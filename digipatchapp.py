@@ -1,52 +1,169 @@
 import streamlit as st
-import datetime
+import io
+import random
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import praw
+import queue
 import re
+import sys
 from praw.exceptions import APIException, PRAWException
 import prawcore
 import time
-from functools import wraps
+import zipfile
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial, wraps
+from itertools import count, islice
 from typing import List, Optional, Generator
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # ======================
 # Configuration Constants
 # ======================
 MAX_RETRIES = 5
 BASE_SLEEP_MULTIPLIER = 5
+MAX_BACKOFF_SECONDS = 60  # Upper bound on the congestion backoff (the reset wait may exceed it)
+ATB_WINDOW = 32  # Recent request outcomes used to estimate congestion
+REQUESTS_PER_MINUTE = 95  # Fallback pace, just under Reddit's 100 QPM for OAuth clients
+MAX_WORKERS = 8  # Concurrent comment fetches; keeps bursts well under the 100 QPM budget
+LOW_REMAINING = 10  # Below this many requests left, pace more conservatively
+LOW_REMAINING_SAFETY = 1.5  # Interval multiplier while the budget is nearly spent
+# Seconds a fetched listing is reused: fast-moving sorts expire quickly, "top" barely changes
+LISTING_CACHE_TTL = {"hot": 60, "new": 60, "rising": 60, "controversial": 600, "top": 86_400}
+LISTING_PAGE_SIZE = 100  # Posts Reddit returns per listing request
+LISTING_MAX_POSTS = 1000  # Reddit stops serving a listing after about this many posts
+COMMENT_LIMIT_MARGIN = 10  # Extra comments asked for, to cover deleted ones that get dropped
+REPLACE_MORE_LIMIT = 8  # Most "load more" stubs expanded per post (one request each)
+COMMENT_CACHE_TTL = 3600  # Comment trees change slowly; keep them longer
+PROGRESS_REFRESH_SECONDS = 0.5  # UI refresh cadence while a collection runs
+NOTICES_SHOWN = 5  # Most recent collection warnings/errors kept on screen
+CSV_CHUNK_SIZE = 10_000  # Rows per batch when exporting CSV
+
+# Listing endpoints by sorting method, resolved once instead of per call
+SORT_METHODS = {
+    "hot": praw.models.Subreddit.hot,
+    "new": praw.models.Subreddit.new,
+    "top": praw.models.Subreddit.top,
+    "controversial": praw.models.Subreddit.controversial,
+    "rising": praw.models.Subreddit.rising,
+}
 
 # ==============
 # Data Storage
 # ==============
+POST_COLUMNS = [
+    "Subreddit", "Post ID", "Title", "Author", "Score",
+    "Comments Count", "Upvote Ratio", "URL", "Created", "Sort Method"
+]
+COMMENT_COLUMNS = [
+    "Post ID", "Comment ID", "Comment Author", "Comment Score",
+    "Comment Body", "Comment Timestamp"
+]
+# Narrow dtypes: repeated labels as categories, counts as 32-bit integers
+# Unique, high-cardinality text goes into Arrow string buffers instead of one Python object per cell
+ARROW_STRING = "string[pyarrow]"
+POST_DTYPES = {
+    "Subreddit": "category", "Author": "category", "Sort Method": "category",
+    "Post ID": ARROW_STRING, "Title": ARROW_STRING, "URL": ARROW_STRING,
+    "Score": "Int32", "Comments Count": "Int32", "Upvote Ratio": "float32"
+}
+COMMENT_DTYPES = {
+    "Post ID": ARROW_STRING, "Comment ID": ARROW_STRING, "Comment Body": ARROW_STRING,
+    "Comment Author": "category", "Comment Score": "Int32"
+}
+# Low-cardinality text repeated across many rows; stored as one shared string each
+INTERNED_COLUMNS = frozenset({"Subreddit", "Sort Method", "Author", "Comment Author"})
+# Bodies left behind by deleted or moderator-removed comments; these are skipped
+DELETED_BODIES = frozenset({"[deleted]", "[removed]"})
+# Reddit subreddit names: letters, digits and underscores (a few legacy names have 2 chars)
+SUBREDDIT_NAME_RE = re.compile(r"(?:/?r/)?([A-Za-z0-9_]{2,21})")
+NON_WORD_RE = re.compile(r"\W+")  # Stripped from subreddit input when naming export files
+FILENAME_TIME_FORMAT = "%Y%m%d_%H%M%S"
+
 class RedditDataStore:
+    """Columnar (dict-of-lists) store; timestamps are kept as raw epoch floats.
+
+    Inserts are idempotent: a post already stored for the same sort method, or a
+    comment ID already stored, is ignored, so resuming a collection never
+    duplicates rows. Comment bodies are stripped on insert, and a comment
+    repeating a body already stored for the same post is dropped. Built
+    DataFrames are reused until the next insert, so reruns that only redraw
+    the page do not rebuild or re-merge them; treat them as read-only.
+    """
     def __init__(self):
-        self.posts = []
-        self.comments = []
+        self.posts = {column: [] for column in POST_COLUMNS}
+        self.comments = {column: [] for column in COMMENT_COLUMNS}
+        self._post_keys = set()
+        self._comment_ids = set()
+        self._comment_bodies = set()  # (Post ID, stripped body) pairs already stored
+        self._frames = {}
+
+    @staticmethod
+    def _cell(record: dict, column: str):
+        value = record[column]
+        if column in INTERNED_COLUMNS and isinstance(value, str):
+            return sys.intern(value)
+        return value
+
+    def add_post(self, post: dict) -> None:
+        key = (post["Post ID"], post["Sort Method"])
+        if key in self._post_keys:
+            return
+        self._post_keys.add(key)
+        self._frames.clear()
+        for column, values in self.posts.items():
+            values.append(self._cell(post, column))
+
+    def add_comment(self, comment: dict) -> None:
+        if comment["Comment ID"] in self._comment_ids:
+            return
+        self._comment_ids.add(comment["Comment ID"])
+        body = comment["Comment Body"].strip()
+        if (comment["Post ID"], body) in self._comment_bodies:
+            return
+        self._comment_bodies.add((comment["Post ID"], body))
+        comment = {**comment, "Comment Body": body}
+        self._frames.clear()
+        for column, values in self.comments.items():
+            values.append(self._cell(comment, column))
+
+    @property
+    def post_count(self) -> int:
+        return len(self.posts["Post ID"])
+
+    @property
+    def comment_count(self) -> int:
+        return len(self.comments["Comment ID"])
+
+    @property
+    def posts_df(self) -> pd.DataFrame:
+        """Posts with timestamps converted in one vectorized pass."""
+        if "posts" not in self._frames:
+            df = pd.DataFrame(self.posts)
+            df["Created"] = pd.to_datetime(df["Created"], unit="s", utc=True)
+            self._frames["posts"] = df.astype(POST_DTYPES)
+        return self._frames["posts"]
+
+    @property
+    def comments_df(self) -> pd.DataFrame:
+        if "comments" not in self._frames:
+            df = pd.DataFrame(self.comments)
+            df["Comment Timestamp"] = pd.to_datetime(df["Comment Timestamp"], unit="s", utc=True)
+            self._frames["comments"] = df.astype(COMMENT_DTYPES)
+        return self._frames["comments"]
 
     @property
     def all_data(self):
         """Merge posts and comments if comments exist.
-           When comments are downloaded, remove duplicate comments per post based on 'Comment Body'."""
-        if self.comments:
-            df_posts = pd.DataFrame(self.posts, columns=[
-                "Subreddit", "Post ID", "Title", "Author", "Score", 
-                "Comments Count", "Upvote Ratio", "URL", "Created", "Sort Method"
-            ])
-            df_comments = pd.DataFrame(self.comments, columns=[
-                "Post ID", "Comment Author", "Comment Score", 
-                "Comment Body", "Comment Timestamp"
-            ])
-            # Normalize comment bodies by stripping extra whitespace
-            df_comments["Comment Body"] = df_comments["Comment Body"].str.strip()
-            # Remove duplicate comments for the same post based on Post ID and Comment Body
-            df_comments = df_comments.drop_duplicates(subset=["Post ID", "Comment Body"])
-            merged = pd.merge(df_posts, df_comments, on="Post ID", how="right")
-            return merged
-        else:
-            return pd.DataFrame(self.posts, columns=[
-                "Subreddit", "Post ID", "Title", "Author", "Score", 
-                "Comments Count", "Upvote Ratio", "URL", "Created", "Sort Method"
-            ])
+           Duplicate comments per post were already dropped on insert."""
+        if not self.comments["Post ID"]:
+            return self.posts_df
+        if "all" not in self._frames:
+            self._frames["all"] = pd.merge(self.posts_df, self.comments_df, on="Post ID", how="right")
+        return self._frames["all"]
 
 # ======================
 # Helper Functions
@@ -61,52 +178,244 @@ def add_footer() -> None:
     [LinkedIn](https://www.linkedin.com/in/gabriele-di-cicco-124067b0/)
     """)
 
+class RetryStats:
+    """Rolling record of recent request outcomes for adaptive (ATB) backoff."""
+    def __init__(self):
+        self.outcomes = deque(maxlen=ATB_WINDOW)  # True = ok, False = 429
+
+    def record(self, ok: bool) -> None:
+        self.outcomes.append(ok)
+
+    @property
+    def congestion(self) -> float:
+        """Share of recent requests that were rate limited."""
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def next_delay(self, retries: int) -> float:
+        """Backoff that grows faster the more congested the API has recently been.
+
+        A random exponential term, larger under congestion, spreads out
+        workers that were rate limited together so they do not retry at once;
+        the sum is capped at MAX_BACKOFF_SECONDS.
+        """
+        delay = BASE_SLEEP_MULTIPLIER * (1 + self.congestion) ** (retries + 1)
+        if self.congestion:
+            delay += random.expovariate(1 / (BASE_SLEEP_MULTIPLIER * self.congestion))
+        return min(MAX_BACKOFF_SECONDS, delay)
+
+def retry_stats() -> RetryStats:
+    """Return the session's RetryStats, kept in session state so it survives reruns."""
+    if "retry_stats" not in st.session_state:
+        st.session_state.retry_stats = RetryStats()
+    return st.session_state.retry_stats
+
+# Per pool thread: its own Reddit client and the running collection's notice queue
+_worker = threading.local()
+
+def report(level: str, message: str) -> None:
+    """Show a warning or error, or hand it to the running collection on a pool thread.
+
+    Pool threads outlive the script run that started them, so an st.warning
+    there would land at an arbitrary spot or be wiped by the next refresh;
+    their notices travel with the collected records instead.
+    """
+    notices = getattr(_worker, "notices", None)
+    if notices is None:
+        getattr(st, level)(message)
+    else:
+        notices.put((level, message))
+
 def handle_rate_limit(func):
     """Decorator for handling Reddit API rate limits."""
     @wraps(func)
     def wrapper(*args, **kwargs):
+        stats = retry_stats()
         retries = 0
         while retries < MAX_RETRIES:
             try:
-                return func(*args, **kwargs)
+                result = func(*args, **kwargs)
+                stats.record(True)
+                return result
             except prawcore.exceptions.TooManyRequests as e:
-                sleep_time = BASE_SLEEP_MULTIPLIER * (retries + 1)
-                st.warning(f"Rate limited. Retrying in {sleep_time}s...")
+                stats.record(False)
+                # Wait at least as long as Reddit asks (Retry-After) and until its
+                # window resets, longer if congestion is high.
+                reset = e.response.headers.get("x-ratelimit-reset")
+                sleep_time = max(float(e.retry_after or 0), float(reset or 0),
+                                 stats.next_delay(retries))
+                report("warning", f"Rate limited. Retrying in {sleep_time:.1f}s...")
                 time.sleep(sleep_time)
                 retries += 1
-        st.error("Max retries reached. Skipping this request.")
+        report("error", "Max retries reached. Skipping this request.")
         return None
     return wrapper
 
+class RequestPacer:
+    """Shared pacer that spaces API calls from all worker threads.
+
+    The interval spreads the remaining budget reported in the X-Ratelimit-*
+    headers (``reddit.auth.limits``) over the current window; before Reddit
+    has answered once, it falls back to REQUESTS_PER_MINUTE. Near the end of
+    the budget the interval is stretched, since requests already in flight
+    are not yet reflected in the headers. Each caller reserves the next free
+    slot under the lock and sleeps outside it, so workers are spaced out
+    instead of bursting together. Once the budget is
+    spent, callers wait for the window's reset, and slots from the reset on
+    are spaced at the fresh-window pace rather than the old window's, so the
+    queue neither stalls past the reset nor fires at once when it comes.
+    A caller about to make several calls at once (a replace_more) reserves
+    a slot for each.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._window_end = None  # Reset of the current window, on the monotonic clock
+
+    def wait(self, reddit: praw.Reddit, requests: int = 1) -> None:
+        fresh = 60 / REQUESTS_PER_MINUTE
+        with self._lock:
+            now = time.monotonic()
+            if self._window_end is not None and now >= self._window_end:
+                self._window_end = None
+            limits = reddit.auth.limits
+            remaining, reset = limits.get("remaining"), limits.get("reset_timestamp")
+            left = None if reset is None else reset - time.time()
+            slot = max(now, self._next_slot)
+            if remaining is None or left is None or left <= 0:
+                self._next_slot = slot + requests * fresh
+            else:
+                self._window_end = now + left
+                interval = left / max(remaining, 1)
+                if remaining < LOW_REMAINING:
+                    interval *= LOW_REMAINING_SAFETY
+                if remaining < 1:
+                    slot = max(slot, self._window_end)  # Budget spent: wait for the reset
+                if slot >= self._window_end:
+                    interval = fresh
+                self._next_slot = min(slot + requests * interval,
+                                      max(slot, self._window_end) + requests * fresh)
+        time.sleep(slot - now)
+
+def paced(reddit: praw.Reddit, listing) -> Generator:
+    """Iterate a listing, waiting for a pacer slot before each page is fetched."""
+    pacer = request_pacer(reddit.config.client_id)
+    items = iter(listing)
+    for position in count():
+        if position % LISTING_PAGE_SIZE == 0:
+            pacer.wait(reddit)
+        try:
+            yield next(items)
+        except StopIteration:
+            return
+
+@st.cache_resource(show_spinner=False)
+def request_pacer(client_id: str) -> RequestPacer:
+    """Return the pacer for an OAuth client, shared by every session using it.
+
+    Reddit budgets requests per client ID, and all Streamlit sessions run in
+    this one process, so sessions with the same credentials share one pacer
+    while different credentials keep separate budgets.
+    """
+    return RequestPacer()
+
+def build_reddit_client(client_id: str, client_secret: str,
+                        username: str, password: str) -> praw.Reddit:
+    """Build a Reddit client; no request is made until it is first used."""
+    return praw.Reddit(
+        client_id=client_id,
+        client_secret=client_secret,
+        username=username,
+        password=password,
+        user_agent=f"DigiPatch data collection (by /u/{username})",
+        check_for_async=False
+    )
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def get_reddit_client(client_id: str, client_secret: str,
+                      username: str, password: str) -> praw.Reddit:
+    """Client for the credential check, cached per credentials so reruns reuse its token.
+
+    It is shared by every session with these credentials, so it is only used
+    under CLIENT_CHECK_LOCK; collections run on per-thread clients instead.
+    """
+    return build_reddit_client(client_id, client_secret, username, password)
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def idle_worker_clients(client_id: str, client_secret: str,
+                        username: str, password: str) -> queue.SimpleQueue:
+    """Per-thread clients for these credentials that no running collection holds.
+
+    A pool thread takes one (building one only if none is idle) and the
+    collection puts them back when its pool shuts down, so each client serves
+    one thread at a time and later runs reuse its OAuth token instead of
+    making a fresh token grant per thread.
+    """
+    return queue.SimpleQueue()
+
+# PRAW does not document Reddit instances as thread-safe: prawcore updates its
+# rate limiter and token state without locks. The cached client is only used
+# under this lock, and every pool thread holds its own client.
+CLIENT_CHECK_LOCK = threading.Lock()
+
+def init_worker(ctx, credentials: dict, notices: queue.SimpleQueue,
+                idle: queue.SimpleQueue, taken: list) -> None:
+    """Pool initializer: attach the script context and give the thread its own client.
+
+    The client comes from ``idle`` when one is available and is recorded in
+    ``taken`` so the collection can return it afterwards.
+    """
+    add_script_run_ctx(None, ctx)
+    try:
+        reddit = idle.get_nowait()
+    except queue.Empty:
+        reddit = build_reddit_client(**credentials)
+    taken.append(reddit)
+    _worker.reddit = reddit
+    _worker.notices = notices
+
 @handle_rate_limit
 def initialize_reddit(client_id: str, client_secret: str, 
                      username: str, password: str) -> Optional[praw.Reddit]:
-    """Initialize and return an authenticated Reddit instance."""
+    """Return a Reddit client after checking its credentials with one request.
+
+    Building the client makes no request and is cached, so a rate-limit retry
+    repeats only the check, not the construction.
+    """
     try:
-        return praw.Reddit(
-            client_id=client_id,
-            client_secret=client_secret,
-            username=username,
-            password=password,
-            user_agent=f"DigiPatch data collection (by /u/{username})",
-            check_for_async=False
-        )
-    except PRAWException as e:
+        reddit = get_reddit_client(client_id, client_secret, username, password)
+        with CLIENT_CHECK_LOCK:
+            reddit.user.me()
+        return reddit
+    except prawcore.exceptions.TooManyRequests:
+        raise  # Let handle_rate_limit back off and retry
+    except (PRAWException, prawcore.exceptions.PrawcoreException) as e:
         st.error(f"Authentication failed: {str(e)}")
         return None
 
-def process_post(post: praw.models.Submission, subreddit: str, sorting_method: str) -> dict:
+def author_name(author: Optional[praw.models.Redditor]) -> Optional[str]:
+    """Name of a post/comment author without going through Redditor.__str__.
+
+    ``.name`` is filled in from the listing payload; None for deleted accounts.
+    """
+    try:
+        return author.name if author else None
+    except AttributeError:
+        return None
+
+def process_post(post: praw.models.Submission, sorting_method: str) -> dict:
     """Extract post metadata."""
     return {
-        "Subreddit": subreddit,
+        "Subreddit": post.subreddit.display_name,
         "Post ID": post.id,
         "Title": post.title,
-        "Author": str(post.author),
+        "Author": author_name(post.author),
         "Score": post.score,
         "Comments Count": post.num_comments,
         "Upvote Ratio": post.upvote_ratio,
         "URL": post.url,
-        "Created": datetime.datetime.fromtimestamp(post.created_utc, datetime.timezone.utc),
+        "Created": post.created_utc,
         "Sort Method": sorting_method
     }
 
@@ -114,57 +423,253 @@ def process_comment(comment: praw.models.Comment) -> dict:
     """Extract comment details."""
     return {
         "Post ID": comment.submission.id,
-        "Comment Author": str(comment.author) if comment.author else None,
+        "Comment ID": comment.id,
+        "Comment Author": author_name(comment.author),
         "Comment Score": comment.score,
         "Comment Body": comment.body,
-        "Comment Timestamp": datetime.datetime.fromtimestamp(comment.created_utc, datetime.timezone.utc)
+        "Comment Timestamp": comment.created_utc
     }
 
+def iter_comments(forest: praw.models.comment_forest.CommentForest) -> Generator:
+    """Walk a comment forest breadth-first, skipping unexpanded MoreComments stubs.
+
+    Same order as CommentForest.list(), but lazy, so callers can stop as soon
+    as they have enough comments instead of flattening the whole tree.
+    """
+    pending = deque(forest)
+    while pending:
+        item = pending.popleft()
+        if isinstance(item, praw.models.Comment):
+            yield item
+            pending.extend(item.replies)
+
+@st.cache_data(ttl=COMMENT_CACHE_TTL, show_spinner=False)
+def fetch_post_comments(_reddit: praw.Reddit, username: str, post_id: str, comment_lim: int) -> List[dict]:
+    """Fetch a limited number of comments for a post.
+
+    Cached per account, post ID and limit: what a post shows depends on who
+    asks (private or quarantined subreddits), so sessions logged in as
+    different users never share entries.
+    """
+    request_pacer(_reddit.config.client_id).wait(_reddit)
+    post = _reddit.submission(id=post_id)
+    # Sample the top comments and let Reddit return only about as many as are
+    # wanted, plus a margin for deleted ones, so the first page is both short
+    # and usually sufficient.
+    post.comment_sort = "top"
+    post.comment_limit = comment_lim + COMMENT_LIMIT_MARGIN
+
+    def kept(forest) -> List[praw.models.Comment]:
+        visible = (c for c in iter_comments(forest) if c.body not in DELETED_BODIES)
+        return list(islice(visible, comment_lim))
+
+    # Only expand the "load more" stubs (one extra request each) when that page
+    # is too small and actually has some, and then only a bounded number of them.
+    comments = kept(post.comments)
+    if len(comments) < comment_lim:
+        stubs = sum(isinstance(item, praw.models.MoreComments) for item in post.comments.list())
+        expand = min(stubs, REPLACE_MORE_LIMIT)
+        if expand:
+            request_pacer(_reddit.config.client_id).wait(_reddit, requests=expand)
+            post.comments.replace_more(limit=expand)
+            comments = kept(post.comments)
+    return [process_comment(c) for c in comments]
+
 @handle_rate_limit
-def get_post_comments(post: praw.models.Submission, comment_lim: int) -> List[dict]:
+def get_post_comments(reddit: praw.Reddit, post_id: str, comment_lim: int) -> List[dict]:
     """Retrieve a limited number of comments for a post."""
     try:
-        post.comments.replace_more(limit=None)
-        all_comments = [c for c in post.comments.list() if isinstance(c, praw.models.Comment)]
-        comments = all_comments[:comment_lim]
-        return [process_comment(c) for c in comments if c.body not in ["[deleted]", "[removed]"]]
+        return fetch_post_comments(reddit, reddit.config.username, post_id, comment_lim)
+    except prawcore.exceptions.TooManyRequests:
+        raise  # Let handle_rate_limit back off and retry
     except Exception as e:
-        st.error(f"Error retrieving comments: {str(e)}")
+        report("error", f"Error retrieving comments: {str(e)}")
         return []
 
-def collect_reddit_data(reddit: praw.Reddit,
-                        subreddit: str,
+@st.cache_data(ttl=max(LISTING_CACHE_TTL.values()), max_entries=256, show_spinner=False)
+def _fetch_listing(_reddit: praw.Reddit, username: str, subreddits: List[str], sorting_method: str,
+                   post_limit: int, cache_window: int) -> List[dict]:
+    """Fetch one sorted listing across subreddits as post records.
+
+    All subreddits are first read through a single combined r/a+b+c listing,
+    so the number of listing requests does not grow with the number of
+    subreddits; at most post_limit posts are kept per subreddit. That listing
+    stops after about 1000 posts and busy subreddits crowd out quiet ones, so
+    when it was cut off, any subreddit still short is topped up from its own
+    listing; a subreddit that cannot be read is reported and skipped.
+    Cached on the arguments except the Reddit instance, so per account
+    (username); cache_window rolls over to expire an entry.
+    """
+    combined = _reddit.subreddit("+".join(subreddits))
+    combined_limit = post_limit * len(subreddits)
+    listing = SORT_METHODS[sorting_method](combined, limit=combined_limit)
+    per_subreddit = dict.fromkeys((name.lower() for name in subreddits), 0)
+    seen = set()
+    records = []
+    for post in paced(_reddit, listing):
+        seen.add(post.id)
+        name = post.subreddit.display_name.lower()
+        if per_subreddit.get(name, 0) >= post_limit:
+            continue
+        per_subreddit[name] = per_subreddit.get(name, 0) + 1
+        records.append(process_post(post, sorting_method))
+    # If the combined listing ran out on its own, every subreddit's posts were
+    # in it; with one subreddit, its own listing is the same one.
+    if len(subreddits) == 1 or len(seen) < min(combined_limit, LISTING_MAX_POSTS):
+        return records
+    for name in subreddits:
+        if per_subreddit[name.lower()] >= post_limit:
+            continue
+        try:
+            listing = SORT_METHODS[sorting_method](_reddit.subreddit(name), limit=post_limit)
+            for post in paced(_reddit, listing):
+                if per_subreddit[name.lower()] >= post_limit:
+                    break
+                if post.id not in seen:
+                    per_subreddit[name.lower()] += 1
+                    seen.add(post.id)
+                    records.append(process_post(post, sorting_method))
+        except prawcore.exceptions.TooManyRequests:
+            raise  # Let handle_rate_limit back off and retry
+        except prawcore.exceptions.ResponseException as e:
+            # Private, banned or misspelled subreddits fail here; keep the others.
+            report("warning", f"Could not read r/{name}: {str(e)}")
+    return records
+
+@handle_rate_limit
+def fetch_sorted_posts(reddit: praw.Reddit, subreddits: List[str], sorting_method: str,
+                       post_limit: int) -> List[dict]:
+    """Fetch a listing, reusing a cached copy for as long as that sort stays fresh.
+
+    Warns about subreddits that still returned fewer than post_limit posts
+    (small subreddits, or Reddit's cap of about 1000 posts per listing).
+    """
+    ttl = LISTING_CACHE_TTL.get(sorting_method, 60)
+    records = _fetch_listing(reddit, reddit.config.username, subreddits, sorting_method, post_limit,
+                             cache_window=int(time.time() // ttl))
+    per_subreddit = Counter(record["Subreddit"].lower() for record in records)
+    short = [f"r/{name} ({per_subreddit[name.lower()]})" for name in subreddits
+             if per_subreddit[name.lower()] < post_limit]
+    if short:
+        report("warning", f"Fewer than {post_limit} '{sorting_method}' posts available for: "
+                          f"{', '.join(short)}.")
+    return records
+
+def collect_reddit_data(credentials: dict,
+                        subreddits: List[str],
                         sorting_methods: List[str],
                         post_limit: int,
                         collect_comments: bool,
                         comment_lim: int) -> Generator:
-    """Main data collection generator."""
-    total_operations = len(sorting_methods) * post_limit
+    """Main data collection generator.
+
+    Listings for every sorting method and the comment trees of their posts
+    are fetched concurrently on a thread pool (the work is network-bound and
+    PRAW releases the GIL on socket reads), while records are still yielded
+    in sorting-method and listing order on the calling thread. Fetching and
+    consuming are pipelined: comment fetches for every listing are queued as
+    soon as that listing arrives. Each pool thread uses its own Reddit client
+    for ``credentials``, reused across collections. Warnings and errors are yielded as
+    ("warning"/"error", message) records alongside the data.
+    """
+    total_operations = len(sorting_methods) * len(subreddits) * post_limit
     processed = 0
-    subreddit_obj = reddit.subreddit(subreddit)
-    for method in sorting_methods:
-        try:
-            posts = getattr(subreddit_obj, method)(limit=post_limit)
-            for post in posts:
-                # Process and yield post data
-                post_data = process_post(post, subreddit, method)
-                yield ("post", post_data)
+
+    def fetch_listing(method: str) -> Optional[List[dict]]:
+        return fetch_sorted_posts(_worker.reddit, subreddits, method, post_limit)
+
+    def fetch_comments(post_data: dict) -> Optional[List[dict]]:
+        return get_post_comments(_worker.reddit, post_data["Post ID"], comment_lim)
+
+    notices = queue.SimpleQueue()
+
+    def pending_notices() -> Generator:
+        while not notices.empty():
+            yield notices.get()
+
+    idle, taken = idle_worker_clients(**credentials), []
+    # Worker threads share the script context so session state and caches stay reachable.
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS,
+                                  initializer=init_worker,
+                                  initargs=(get_script_run_ctx(), credentials, notices, idle, taken))
+    try:
+        listings = {method: executor.submit(fetch_listing, method) for method in sorting_methods}
+        comment_futures = {}
+        if collect_comments:
+            # Queue each listing's comment fetches as soon as it lands, so the pool keeps
+            # fetching while earlier sorting methods are still being consumed below.
+            # A post listed under several sorting methods is fetched only once, and a
+            # post the listing reports as having no comments is not fetched at all.
+            methods = {listing: method for method, listing in listings.items()}
+            fetches = {}
+            for listing in as_completed(methods):
+                if listing.exception() is None:
+                    posts = listing.result() or []
+                    for post_data in posts:
+                        if post_data["Post ID"] not in fetches:
+                            fetches[post_data["Post ID"]] = (executor.submit(fetch_comments, post_data)
+                                                             if post_data["Comments Count"] else None)
+                    comment_futures[methods[listing]] = [fetches[post_data["Post ID"]] for post_data in posts]
+        for method, listing in listings.items():
+            try:
+                posts = listing.result() or []
                 if collect_comments:
-                    comments = get_post_comments(post, comment_lim)
-                    for comment in comments:
+                    comment_batches = (future.result() if future else []
+                                       for future in comment_futures[method])
+                else:
+                    comment_batches = ([] for _ in posts)
+                for post_data, comments in zip(posts, comment_batches):
+                    yield ("post", post_data)
+                    for comment in comments or []:
                         yield ("comment", comment)
-                processed += 1
-                progress = processed / total_operations
-                yield ("progress", progress)
-        except PRAWException as e:
-            st.error(f"Error retrieving posts with method '{method}': {str(e)}")
-
-def rerun_app():
-    """Attempt to rerun the app. If st.experimental_rerun() is not available, display an info message."""
-    if hasattr(st, "experimental_rerun"):
-        st.experimental_rerun()
-    else:
-        st.info("Data cleared. Please refresh the page manually.")
+                    processed += 1
+                    progress = processed / total_operations
+                    yield ("progress", progress)
+                    yield from pending_notices()
+            except (PRAWException, prawcore.exceptions.PrawcoreException) as e:
+                yield ("error", f"Error retrieving posts with method '{method}': {str(e)}")
+        yield from pending_notices()
+    finally:
+        # Drop queued fetches if the consumer stops early (e.g. a cancelled collection).
+        executor.shutdown(cancel_futures=True)
+        for reddit in taken:
+            idle.put(reddit)
+
+def collection_running() -> bool:
+    """Whether a background collection thread is alive in this session."""
+    thread = st.session_state.get("collector_thread")
+    return thread is not None and thread.is_alive()
+
+def start_collection(data_gen: Generator) -> None:
+    """Drain a collection generator on a background thread.
+
+    Records are handed to the script thread through a queue in session state
+    (Streamlit elements are not thread-safe); the thread carries the script
+    run context so session state and caches remain reachable.
+    """
+    records = queue.Queue()
+    stop = threading.Event()
+
+    def run():
+        try:
+            for record in data_gen:
+                if stop.is_set():
+                    break
+                records.put(record)
+        except Exception as e:
+            records.put(("error", f"Collection failed: {str(e)}"))
+        finally:
+            data_gen.close()
+            records.put(("done", None))
+
+    thread = threading.Thread(target=run, daemon=True)
+    add_script_run_ctx(thread)
+    st.session_state.collector_queue = records
+    st.session_state.collector_stop = stop
+    st.session_state.collector_thread = thread
+    st.session_state.collection_progress = 0.0
+    st.session_state.collection_notices = []
+    thread.start()
 
 # ======================
 # UI Components
@@ -172,27 +677,53 @@ def rerun_app():
 def credential_inputs() -> dict:
     """Collect Reddit API credentials."""
     st.header("🔑 Reddit API Credentials")
+    # Editing any credential drops cached clients so a stale login is never reused.
+    clear_clients = get_reddit_client.clear
     return {
-        "client_id": st.text_input("Client ID"),
-        "client_secret": st.text_input("Client Secret", type="password"),
-        "username": st.text_input("Username"),
-        "password": st.text_input("Password", type="password")
+        "client_id": st.text_input("Client ID", on_change=clear_clients),
+        "client_secret": st.text_input("Client Secret", type="password", on_change=clear_clients),
+        "username": st.text_input("Username", on_change=clear_clients),
+        "password": st.text_input("Password", type="password", on_change=clear_clients)
     }
 
+def parse_subreddits(text: str) -> List[str]:
+    """Parse comma-separated subreddit names, warning about invalid ones.
+
+    An r/ prefix is accepted and repeated names are kept once, so a name is
+    never fetched twice; malformed names are dropped here instead of failing
+    later as a 404 from Reddit.
+    """
+    names, invalid = {}, []
+    for token in filter(None, map(str.strip, text.split(","))):
+        match = SUBREDDIT_NAME_RE.fullmatch(token)
+        if match:
+            names.setdefault(match.group(1).lower(), match.group(1))
+        else:
+            invalid.append(token)
+    if invalid:
+        st.warning(f"Ignoring invalid subreddit name(s): {', '.join(invalid)}")
+    return list(names.values())
+
 def data_parameters() -> dict:
     """Collect data collection parameters."""
     st.header("📊 Data Parameters")
     params = {}
-    # Single subreddit input
-    params["subreddit"] = st.text_input("Subreddit name", value="python")
+    # One or more subreddits, comma-separated
+    params["subreddit"] = st.text_input("Subreddit name(s), comma-separated", value="python")
+    params["subreddits"] = parse_subreddits(params["subreddit"])
     # Multiple sorting methods allowed
     params["sorting_methods"] = st.multiselect(
         "Sorting Methods",
-        ["hot", "new", "top", "controversial", "rising"],
+        list(SORT_METHODS),
         default=["hot"]
     )
     # Number of posts to download
-    params["post_limit"] = st.number_input("Number of posts to download", min_value=1, value=100, step=1)
+    params["post_limit"] = st.number_input(
+        "Number of posts to download", min_value=1, value=100, step=1,
+        help="Upper limit per subreddit and sorting method. Reddit serves at most about 1000 posts "
+             "per listing, and small subreddits may have fewer; you are warned when a subreddit "
+             "comes up short."
+    )
     # Ask whether to download comments
     params["collect_comments"] = st.checkbox("Download comments as well")
     if params["collect_comments"]:
@@ -202,11 +733,120 @@ def data_parameters() -> dict:
         params["remove_duplicates"] = st.checkbox("Remove duplicate posts (by Post ID)", value=True)
     return params
 
-def generate_filename(subreddit: str) -> str:
+def show_notices(notices: list) -> None:
+    """Show the most recent collection warnings/errors, noting how many were left out."""
+    for level, message in notices[-NOTICES_SHOWN:]:
+        getattr(st, level)(message)
+    if len(notices) > NOTICES_SHOWN:
+        st.caption(f"{len(notices) - NOTICES_SHOWN} earlier message(s) not shown.")
+
+@st.fragment(run_every=PROGRESS_REFRESH_SECONDS)
+def collection_monitor() -> None:
+    """Move records from the collector queue into the data store and show progress."""
+    records = st.session_state.collector_queue
+    store = st.session_state.data_store
+    finished = False
+    while not finished:
+        try:
+            record_type, data = records.get_nowait()
+        except queue.Empty:
+            break
+        if record_type == "post":
+            store.add_post(data)
+        elif record_type == "comment":
+            store.add_comment(data)
+        elif record_type == "progress":
+            st.session_state.collection_progress = data
+        elif record_type in ("warning", "error"):
+            st.session_state.collection_notices.append((record_type, data))
+        elif record_type == "done":
+            finished = True
+
+    # One status element per refresh, however many records arrived since the last one.
+    label = f"Collecting data... {store.post_count} posts, {store.comment_count} comments so far."
+    with st.status(label, expanded=True):
+        st.progress(min(st.session_state.collection_progress, 1.0))
+        show_notices(st.session_state.collection_notices)
+    if st.button("⏹️ Cancel Collection"):
+        st.session_state.collector_stop.set()
+    if finished:
+        del st.session_state.collector_queue
+        st.session_state.collection_finished = True
+        st.rerun()
+
+def generate_filename(subreddit: str, extension: str = "csv") -> str:
     """Generate a filename based on subreddit and timestamp."""
-    clean_sub = re.sub(r'\W+', '', subreddit)
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    return f"reddit_data_{clean_sub}_{timestamp}.csv"
+    clean_sub = NON_WORD_RE.sub("", subreddit)
+    timestamp = time.strftime(FILENAME_TIME_FORMAT)
+    return f"reddit_data_{clean_sub}_{timestamp}.{extension}"
+
+def write_csv(df: pd.DataFrame, sink) -> None:
+    """Write a DataFrame as UTF-8 CSV with PyArrow's multithreaded C writer."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pacsv.write_csv(table, sink, write_options=pacsv.WriteOptions(batch_size=CSV_CHUNK_SIZE))
+
+def dataframe_to_csv(df: pd.DataFrame) -> io.BytesIO:
+    """Write a DataFrame as UTF-8 CSV into a buffer."""
+    buffer = io.BytesIO()
+    write_csv(df, buffer)
+    buffer.seek(0)
+    return buffer
+
+def tables_to_zip(posts: pd.DataFrame, comments: pd.DataFrame, subreddit: str) -> io.BytesIO:
+    """Zip posts and comments as two CSVs linked by Post ID, without the flat join."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, df in (("posts", posts), ("comments", comments)):
+            with archive.open(generate_filename(f"{subreddit}_{name}"), "w") as member:
+                write_csv(df, member)
+    buffer.seek(0)
+    return buffer
+
+def dataframe_to_parquet(df: pd.DataFrame) -> io.BytesIO:
+    """Write a DataFrame as zstd-compressed Parquet into a buffer."""
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, engine="pyarrow", compression="zstd", index=False)
+    buffer.seek(0)
+    return buffer
+
+@st.fragment
+def data_panel(params: dict) -> None:
+    """Preview, export and clear the collected data.
+
+    Runs as a fragment: download and preview interactions rerun only this
+    panel, not the inputs and collection logic above it.
+    """
+    st.header("📦 Collected Data")
+    if params["collect_comments"]:
+        df = st.session_state.data_store.all_data
+    else:
+        df = st.session_state.data_store.posts_df
+        if params.get("remove_duplicates", False):
+            df = df.drop_duplicates(subset=["Post ID"])
+    # Display total instances collected (number of rows in the dataset)
+    total_instances = len(df)
+    st.markdown(f"**Total instances collected: {total_instances}**")
+    st.dataframe(df.head(10), use_container_width=True)
+
+    # Exports are serialized only when their button is clicked, not on every rerun.
+    # Parquet is the compact, typed export; CSV stays for spreadsheet users.
+    st.download_button("💾 Download Parquet", data=partial(dataframe_to_parquet, df),
+                       file_name=generate_filename(params["subreddit"], "parquet"),
+                       mime="application/vnd.apache.parquet")
+    st.download_button("💾 Download CSV", data=partial(dataframe_to_csv, df),
+                       file_name=generate_filename(params["subreddit"]), mime="text/csv")
+    if params["collect_comments"]:
+        # Post fields are repeated on every comment row above; the zip keeps them once.
+        store = st.session_state.data_store
+        # Bind this run's frames: the callable runs later, while a collection may still be adding.
+        tables = partial(tables_to_zip, store.posts_df, store.comments_df, params["subreddit"])
+        st.download_button("💾 Download Posts + Comments (ZIP)", data=tables,
+                           file_name=generate_filename(params["subreddit"], "zip"),
+                           mime="application/zip")
+
+    if st.button("❌ Clear Data"):
+        st.session_state.data_store = RedditDataStore()
+        st.rerun()  # The whole app, not just this fragment
 
 # ======================
 # Main App
@@ -230,61 +870,40 @@ def main():
         if not all(creds.values()):
             st.error("Missing API credentials!")
             return
-            
-        reddit = initialize_reddit(**creds)
-        if not reddit:
+        if not params["subreddits"]:
+            st.error("Enter at least one subreddit!")
+            return
+        if not params["sorting_methods"] or not set(params["sorting_methods"]) <= SORT_METHODS.keys():
+            st.error("Select at least one valid sorting method!")
             return
             
-        data_gen = collect_reddit_data(
-            reddit=reddit,
-            subreddit=params["subreddit"],
-            sorting_methods=params["sorting_methods"],
-            post_limit=params["post_limit"],
-            collect_comments=params["collect_comments"],
-            comment_lim=params.get("comment_lim", 0)
-        )
-        
-        progress_bar = st.progress(0)
-        with st.spinner("Collecting data..."):
-            try:
-                for record in data_gen:
-                    record_type, data = record
-                    if record_type == "post":
-                        st.session_state.data_store.posts.append(data)
-                    elif record_type == "comment":
-                        st.session_state.data_store.comments.append(data)
-                    elif record_type == "progress":
-                        progress_bar.progress(min(data, 1.0))
-            except Exception as e:
-                st.error(f"Collection failed: {str(e)}")
+        if collection_running():
+            st.warning("A collection is already running.")
+        else:
+            if not initialize_reddit(**creds):
+                return
+
+            data_gen = collect_reddit_data(
+                credentials=creds,
+                subreddits=params["subreddits"],
+                sorting_methods=params["sorting_methods"],
+                post_limit=params["post_limit"],
+                collect_comments=params["collect_comments"],
+                comment_lim=params.get("comment_lim", 0)
+            )
+            start_collection(data_gen)
+
+    # Collection runs in the background; a fragment polls for its records.
+    if "collector_queue" in st.session_state:
+        collection_monitor()
+    elif st.session_state.pop("collection_finished", False):
+        show_notices(st.session_state.pop("collection_notices", []))
         st.success("Collection complete!")
     
     # Data Management and Display
-    if st.session_state.data_store.posts:
-        st.header("📦 Collected Data")
-        if params["collect_comments"]:
-            df = st.session_state.data_store.all_data
-        else:
-            df = pd.DataFrame(st.session_state.data_store.posts, columns=[
-                "Subreddit", "Post ID", "Title", "Author", "Score", 
-                "Comments Count", "Upvote Ratio", "URL", "Created", "Sort Method"
-            ])
-            if params.get("remove_duplicates", False):
-                df = df.drop_duplicates(subset=["Post ID"])
-        # Display total instances collected (number of rows in the dataset)
-        total_instances = len(df)
-        st.markdown(f"**Total instances collected: {total_instances}**")
-        st.dataframe(df.head(10), use_container_width=True)
-        
-        # Generate filename and provide a CSV download button.
-        filename = generate_filename(params["subreddit"])
-        csv = df.to_csv(index=False).encode('utf-8')
-        st.download_button("💾 Download CSV", data=csv, file_name=filename, mime="text/csv")
-        
-        if st.button("❌ Clear Data"):
-            st.session_state.data_store = RedditDataStore()
-            rerun_app()
-    
+    if st.session_state.data_store.post_count:
+        data_panel(params)
+
     add_footer()
 
 if __name__ == "__main__":